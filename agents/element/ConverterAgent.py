@@ -1,3 +1,4 @@
+import functools
 import logging
 from langchain_core.prompts import ChatPromptTemplate
 
@@ -27,7 +28,10 @@ def _resolve_system_prompt(target_framework: str | None) -> str:
     return SP_CONVERSION_SYS_PROMPT
 
 
+@functools.lru_cache(maxsize=None)
 def get_conversion_chain(target_framework: str | None = None):
+    # One chain per target framework; rebuilding the prompt template and
+    # model binding for every SP conversion is redundant work
     system_prompt = _resolve_system_prompt(target_framework)
     prompt = ChatPromptTemplate.from_messages(
         [
@@ -1,10 +1,75 @@
+import hashlib
+import itertools
+import mmap
 import os
 import json
+import logging
+import re
 import time
 
-from langchain_core.prompts import ChatPromptTemplate
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; the stdlib json module is the fallback
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    # ijson is optional; large-file lookups fall back to a full parse
+    ijson = None
+
 from agents.element.SchemaAgent import schema_agent
 
+logger = logging.getLogger(__name__)
+
+# orjson parses the multi-MB metadata files several times faster than the
+# stdlib and accepts bytes directly; both raise json.JSONDecodeError
+# subclasses on bad input so callers keep their except clauses
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Compiled once at import time; json_to_dict runs this on every LLM response,
+# so recompiling the pattern per call is wasted work.
+_JSON_BLOCK_RE = re.compile(r'```(?:json)?\s*({[\s\S]*?})\s*```')
+
+# Comment tokens per file extension, compiled to one regex each so that
+# remove_comments can strip a whole file in a single C-level pass instead
+# of a Python loop over every line. The leading [ \t]* also swallows the
+# whitespace before an inline comment, matching the old rstrip behaviour.
+_COMMENT_TOKENS = {
+    '.sql': '--',
+    '.py': '#',
+    '.java': '//',
+    '.js': '//',
+    '.ts': '//',
+    '.c': '//',
+    '.cpp': '//',
+    '.h': '//',
+    '.hpp': '//',
+    '.cs': '//',
+    '.php': '//',
+    '.rb': '#',
+    '.sh': '#',
+    '.bash': '#',
+    '.zsh': '#',
+    '.r': '#',
+    '.pl': '#',
+    '.pm': '#'
+}
+
+_COMMENT_RES = {
+    ext: re.compile(rf'[ \t]*{re.escape(token)}[^\n]*')
+    for ext, token in _COMMENT_TOKENS.items()
+}
+
+# Monotonic thread_id source for agent invocations. Seeded with the start
+# time so ids stay unique across process restarts; next() is cheaper than
+# a uuid and can never collide between concurrent conversions.
+_thread_counter = itertools.count(int(time.time() * 1000))
+
 
 def read_sp(path):
     """
@@ -33,10 +98,156 @@ def save_to_json(filename, data, mode='w'):
         data (dict/list): Data to be saved as JSON
         mode (str): File open mode ('w' for write, 'a' for append)
     """
-    with open(filename, mode) as f:
-        json.dump(data, f, indent=4)
+    if orjson is not None:
+        # orjson serializes straight to utf-8 bytes, so write in binary mode
+        with open(filename, mode + 'b', buffering=1 << 20) as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            f.write(b'\n')
+        return
+
+    # Large write buffer so the indented formatter's many small writes do
+    # not each hit the OS; ensure_ascii=False skips escaping of non-ASCII
+    # payloads (the metadata carries LLM-generated source)
+    with open(filename, mode, buffering=1 << 20, encoding='utf-8') as f:
+        json.dump(data, f, indent=4, ensure_ascii=False)
         f.write('\n')
 
+# Parsed-JSON cache for find_from_json keyed by filename; entries remember
+# the file's mtime so an updated metadata file invalidates its cached parse
+_json_cache = {}
+
+# Merged-dict cache for JSONL logs, also invalidated by mtime
+_jsonl_cache = {}
+
+# Metadata files above this size are streamed with ijson for single-key
+# lookups rather than parsed (and cached) whole
+_STREAM_THRESHOLD = 8 << 20
+
+
+def _stream_json_value(filename, key):
+    """
+    Stream a single top-level key out of a large JSON dict via ijson.
+
+    Parsing stops as soon as the key has been seen, so a lookup costs
+    O(bytes up to the match) instead of a full multi-MB parse whose
+    result would then sit in the cache. Returns a (found, value) pair;
+    found is False when the document is not a dict or the key is absent,
+    and callers fall back to the ordinary full parse.
+
+    Args:
+        filename (str): Path to the JSON file
+        key (str): Top-level key to extract
+
+    Returns:
+        tuple: (found, value)
+    """
+    try:
+        with open(filename, 'rb') as f:
+            # kvitems walks the top-level object pairwise, so keys that
+            # contain dots (e.g. "GetCustomer.sql") need no prefix escaping
+            for k, v in ijson.kvitems(f, ''):
+                if k == key:
+                    return True, v
+    except Exception as e:
+        logger.debug(f"Streaming lookup failed for {filename}: {e}")
+    return False, None
+
+
+def append_to_jsonl(filename, record):
+    """
+    Append a single record to a JSONL metadata log.
+
+    Writes one compact line, so registering a new entry costs O(record)
+    bytes instead of the read-modify-rewrite of a whole JSON document.
+
+    Args:
+        filename (str): Path to the JSONL file
+        record (dict): Record to append
+    """
+    if orjson is not None:
+        with open(filename, 'ab') as f:
+            f.write(orjson.dumps(record))
+            f.write(b'\n')
+    else:
+        with open(filename, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, ensure_ascii=False))
+            f.write('\n')
+
+
+def load_jsonl_index(filename):
+    """
+    Load a JSONL metadata log into one merged dict, cached by mtime.
+
+    Later lines win, so appending an updated record supersedes the old
+    one without ever rewriting the file.
+
+    Args:
+        filename (str): Path to the JSONL file
+
+    Returns:
+        dict: Union of all records, last write wins per key
+    """
+    mtime = os.stat(filename).st_mtime_ns
+    cached = _jsonl_cache.get(filename)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    merged = {}
+    with open(filename, 'rb') as f:
+        for line in f:
+            if line.strip():
+                merged.update(_json_loads(line))
+
+    _jsonl_cache[filename] = (mtime, merged)
+    return merged
+
+
+def _load_indexed_json(filename):
+    """
+    Load and cache a metadata JSON file together with a lookup index.
+
+    For list-shaped files the index maps (key, value.lower()) -> row for
+    every string field of every row, turning the repeated linear scans in
+    find_from_json into O(1) dict hits. Cache entries are refreshed when
+    the file's mtime changes.
+
+    Args:
+        filename (str): Path to the JSON file
+
+    Returns:
+        tuple: (parsed data, index dict)
+    """
+    mtime = os.stat(filename).st_mtime_ns
+    cached = _json_cache.get(filename)
+    if cached is not None and cached[0] == mtime:
+        return cached[1], cached[2]
+
+    if orjson is not None:
+        # orjson consumes bytes natively; reading binary skips the text
+        # decode of the full file
+        with open(filename, 'rb') as f:
+            data = orjson.loads(f.read())
+    else:
+        # json.load streams from the file object without materializing an
+        # intermediate str of the whole document
+        with open(filename, 'r') as f:
+            data = json.load(f)
+
+    index = {}
+    if isinstance(data, list):
+        for row in data:
+            if not isinstance(row, dict):
+                continue
+            for k, v in row.items():
+                if isinstance(v, str):
+                    # setdefault keeps the first matching row, like the
+                    # old front-to-back scan did
+                    index.setdefault((k, v.lower()), row)
+
+    _json_cache[filename] = (mtime, data, index)
+    return data, index
+
+
 def find_from_json(filename, key=None, value=None):
     """
     Retrieves data from a JSON file, with optional filtering by key-value.
@@ -50,8 +261,20 @@ def find_from_json(filename, key=None, value=None):
         dict/list: All data if no key/value provided, or matching object if found
     """
     logger.debug(f"Reading {filename} for key: {key} and value: {value}")
-    with open(filename, 'r') as f:
-        data = json.loads(f.read())
+
+    if key and not value and ijson is not None and filename not in _json_cache:
+        # Single-key lookup on a large, not-yet-cached file: stream just
+        # the matching entry instead of parsing the whole document
+        try:
+            large = os.stat(filename).st_size > _STREAM_THRESHOLD
+        except OSError:
+            large = False
+        if large:
+            found, streamed = _stream_json_value(filename, key)
+            if found:
+                return streamed
+
+    data, index = _load_indexed_json(filename)
 
     if not key and not value:
             return data
@@ -61,74 +284,80 @@ def find_from_json(filename, key=None, value=None):
         if isinstance(data, dict):
             return data.get(key)
         elif isinstance(data, list):
-            for i in data:
-                if i.get(key):
-                    return i
-            else:
-                return None
+            # Guard non-dict rows, which used to raise AttributeError
+            return next((i for i in data if isinstance(i, dict) and i.get(key)), None)
         else:
             return None
     else:
         logger.debug(f"Reading {filename} for key: {key} and value: {value}")
-        for i in data:
-            if i.get(key).lower() == value.lower():
-                return i
-        else:
-            return None
+        return index.get((key, value.lower()))
 
-def read_sql_file(file_path):
+# Fallback encodings tried when the content is not valid UTF-8
+_FALLBACK_ENCODINGS = ['latin1', 'cp1252', 'iso-8859-1', 'utf-16', 'utf-16-le', 'utf-16-be']
+
+# Files above this size are mmap'ed rather than read into a bytes object;
+# below it the mapping setup costs more than the copy it saves
+_MMAP_THRESHOLD = 1 << 20
+
+
+def _decode_bytes(raw, file_path=""):
     """
-    Attempt to read a SQL file with multiple encodings to handle special characters.
+    Decode raw file content with BOM sniffing and encoding fallbacks.
+
+    The file is read once by the callers; all encoding attempts here
+    happen in memory, so trying several encodings never re-reads the
+    file from disk. BOM sniffing replaces the old null-byte scan: a
+    successful BOM-guided or utf-8 decode is trusted as-is, so the
+    common path no longer re-walks the whole decoded string.
 
     Args:
-        file_path: Path to the SQL file
+        raw: Raw file content - bytes or any buffer (e.g. an mmap view)
+        file_path (str): Path of the source file, used only for logging
 
     Returns:
-        The content of the file if successful, or an error message
+        str: Decoded content (never raises; falls back to utf-8 with replacement)
     """
-    # List of encodings to try in order of likelihood
-    encodings = ['utf-8', 'latin1', 'cp1252', 'iso-8859-1', 'utf-16', 'utf-16-le', 'utf-16-be']
+    # Check for UTF-16 / UTF-8 BOM markers (slice instead of startswith so
+    # buffer objects like mmap work too)
+    head = bytes(raw[:3])
+    if head.startswith(b'\xff\xfe') or head.startswith(b'\xfe\xff'):
+        try:
+            content = str(raw, 'utf-16')
+            logger.info(f"✅ Successfully decoded {file_path} using UTF-16 encoding (detected BOM).")
+            return content
+        except UnicodeDecodeError:
+            pass  # Continue with regular approach if BOM decode fails
+    elif head.startswith(b'\xef\xbb\xbf'):
+        try:
+            content = str(raw, 'utf-8-sig')
+            logger.info(f"✅ Successfully decoded {file_path} using UTF-8 encoding (detected BOM).")
+            return content
+        except UnicodeDecodeError:
+            pass
 
-    # First, try to detect BOM to identify UTF-16 encoded files
+    # Fast path: a clean utf-8 decode is trusted without further checks
     try:
-        with open(file_path, 'rb') as f:
-            raw_data = f.read(4)
-            # Check for UTF-16 BOM markers
-            if raw_data.startswith(b'\xff\xfe') or raw_data.startswith(b'\xfe\xff'):
-                with open(file_path, 'r', encoding='utf-16') as f:
-                    content = f.read()
-                    logger.info(f"Successfully read file using UTF-16 encoding (detected BOM).")
-                    return content
-    except Exception:
-        pass  # Continue with regular approach if BOM detection fails
-
-    for encoding in encodings:
+        content = str(raw, 'utf-8')
+        logger.info(f"Successfully decoded {file_path} using utf-8 encoding.")
+        return content
+    except UnicodeDecodeError:
+        pass
+
+    for encoding in _FALLBACK_ENCODINGS:
         try:
-            with open(file_path, 'r', encoding=encoding) as f:
-                content = f.read()
-                # Check if content contains null bytes which indicate wrong encoding
-                if '\x00' in content:
-                    logger.info(f"Found null bytes with {encoding}, trying next...")
-                    continue
-                logger.info(f"Successfully read file using {encoding} encoding.")
-                return content
+            content = str(raw, encoding)
         except UnicodeDecodeError:
-            logger.info(f"Failed to read with {encoding} encoding, trying next...")
+            logger.info(f"Failed to decode {file_path} with {encoding} encoding, trying next...")
             continue
-        except Exception as e:
-            return f"Error: {e}"
+        logger.info(f"Successfully decoded {file_path} using {encoding} encoding.")
+        return content
+
+    # If all encodings failed, remove null bytes and decode with replacement
+    cleaned_content = bytes(raw).replace(b'\x00', b'')
+    logger.info(f"Used fallback for {file_path}: null byte removal with utf-8 replace")
+    return cleaned_content.decode('utf-8', errors='replace')
+
 
-    # If all encodings failed, try binary mode and replace null bytes
-    try:
-        with open(file_path, 'rb') as f:
-            binary_content = f.read()
-            # Remove null bytes and attempt to decode
-            cleaned_content = binary_content.replace(b'\x00', b'')
-            content = cleaned_content.decode('utf-8', errors='replace')
-            logger.info("Used fallback: binary read with null byte removal")
-            return content
-    except Exception as e:
-        return f"Error: Unable to read file with any encoding: {e}"
 
 
 def json_to_dict(json_data):
@@ -141,28 +370,30 @@ def json_to_dict(json_data):
     Returns:
         A dictionary containing the parsed dependencies or an empty dict if parsing fails
     """
-    try:
-        # Check if the input is already a dictionary
-        if isinstance(json_data, dict):
-            return json_data
+    # Check if the input is already a dictionary
+    if isinstance(json_data, dict):
+        return json_data
 
-        # Try to parse the JSON string
-        import json
-        import re
+    try:
+        # Most responses are plain JSON, so try parsing the string directly
+        # before paying for the markdown-codeblock regex
+        return _json_loads(json_data)
+    except json.JSONDecodeError:
+        pass
+    except (ValueError, TypeError) as e:
+        logger.info(f"Error extracting dependencies dictionary: {e}")
+        return {}
 
+    try:
         # Sometimes JSON strings might have markdown formatting or code blocks
         # Try to extract the JSON content if it's inside code blocks
-        json_match = re.search(r'```(?:json)?\s*({[\s\S]*?})\s*```', json_data)
+        json_match = _JSON_BLOCK_RE.search(json_data)
         if json_match:
-            clean_json = json_match.group(1)
-            return json.loads(clean_json)
-
-        # If no code blocks, try parsing the string directly
-        return json.loads(json_data)
-
-    except Exception as e:
+            return _json_loads(json_match.group(1))
+    except (ValueError, TypeError) as e:
         logger.info(f"Error extracting dependencies dictionary: {e}")
-        return {}
+
+    return {}
 
 
 def read_file_content(file_path):
@@ -176,48 +407,22 @@ def read_file_content(file_path):
     Returns:
         str: File content as string, or error message if failed
     """
-    encodings = ['utf-8', 'latin1', 'cp1252', 'iso-8859-1', 'utf-16', 'utf-16-le', 'utf-16-be']
-
-    # First, try to detect BOM to identify UTF-16 encoded files
-    try:
-        with open(file_path, 'rb') as f:
-            raw_data = f.read(4)
-            # Check for UTF-16 BOM markers
-            if raw_data.startswith(b'\xff\xfe') or raw_data.startswith(b'\xfe\xff'):
-                with open(file_path, 'r', encoding='utf-16') as f:
-                    content = f.read()
-                    logger.info(f"✅ Successfully read {file_path} using UTF-16 encoding (detected BOM).")
-                    return content
-    except Exception:
-        pass  # Continue with regular approach if BOM detection fails
-
-    for encoding in encodings:
-        try:
-            with open(file_path, 'r', encoding=encoding) as f:
-                content = f.read()
-                # Check if content contains null bytes which indicate wrong encoding
-                if '\x00' in content:
-                    logger.info(f"Found null bytes with {encoding}, trying next...")
-                    continue
-                logger.info(f"Successfully read {file_path} using {encoding} encoding.")
-                return content
-        except UnicodeDecodeError:
-            logger.info(f"Failed to read {file_path} with {encoding} encoding, trying next...")
-            continue
-        except Exception as e:
-            return f"Error reading {file_path}: {e}"
-
-    # If all encodings failed, try binary mode and replace null bytes
     try:
         with open(file_path, 'rb') as f:
-            binary_content = f.read()
-            # Remove null bytes and attempt to decode
-            cleaned_content = binary_content.replace(b'\x00', b'')
-            content = cleaned_content.decode('utf-8', errors='replace')
-            logger.info(f"Used fallback for {file_path}: binary read with null byte removal")
-            return content
+            if os.fstat(f.fileno()).st_size > _MMAP_THRESHOLD:
+                # Large files: decode straight from the mapped pages
+                # instead of first copying them into a bytes object
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return _decode_bytes(mm, file_path)
+            raw = f.read()
     except Exception as e:
-        return f"Error: Unable to read {file_path} with any encoding: {e}"
+        return f"Error reading {file_path}: {e}"
+    return _decode_bytes(raw, file_path)
+
+
+# read_sql_file and read_file_content were byte-for-byte identical; keep the
+# SQL-flavoured name as an alias so existing callers keep working
+read_sql_file = read_file_content
 
 
 def remove_comments(content, file_extension):
@@ -234,54 +439,33 @@ def remove_comments(content, file_extension):
     if not content:
         return content
 
-    lines = content.split('\n')
-    cleaned_lines = []
-
-    # Define comment patterns based on file extension
-    comment_patterns = {
-        '.sql': '--',
-        '.py': '#',
-        '.java': '//',
-        '.js': '//',
-        '.ts': '//',
-        '.c': '//',
-        '.cpp': '//',
-        '.h': '//',
-        '.hpp': '//',
-        '.cs': '//',
-        '.php': '//',
-        '.rb': '#',
-        '.sh': '#',
-        '.bash': '#',
-        '.zsh': '#',
-        '.r': '#',
-        '.pl': '#',
-        '.pm': '#'
-    }
-
-    comment_start = comment_patterns.get(file_extension.lower())
+    # Typical extensions (.py, .sql, ...) are already lowercase, so try the
+    # identity lookup first and only pay for .lower()'s allocation on miss
+    pattern = _COMMENT_RES.get(file_extension) or _COMMENT_RES.get(file_extension.lower())
 
-    if not comment_start:
+    if not pattern:
         # If we don't recognize the file type, return original content
         return content
 
-    for line in lines:
-        # Find the position of the comment start
-        comment_pos = line.find(comment_start)
+    # Single regex sweep over the whole buffer instead of a per-line
+    # Python loop with split/find/join
+    return pattern.sub('', content)
 
-        if comment_pos == -1:
-            # No comment in this line, keep the entire line
-            cleaned_lines.append(line)
-        elif comment_pos == 0:
-            # Line starts with comment, skip entirely (but keep empty line for structure)
-            cleaned_lines.append('')
-        else:
-            # Comment is inline, keep only the part before the comment
-            # But be careful with strings that might contain the comment pattern
-            cleaned_line = line[:comment_pos].rstrip()
-            cleaned_lines.append(cleaned_line)
 
-    return '\n'.join(cleaned_lines)
+def _iter_files(root, rel=''):
+    """
+    Recursively yield (absolute_path, relative_path) for every file under root.
+
+    Built on os.scandir so directory entries carry their cached file type
+    (no per-entry stat), and the relative key is extended incrementally
+    during recursion instead of calling os.path.relpath per file.
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_files(entry.path, rel + entry.name + '/')
+            elif entry.is_file():
+                yield entry.path, rel + entry.name
 
 
 def path_to_content_dict(in_path):
@@ -318,26 +502,26 @@ def path_to_content_dict(in_path):
         elif os.path.isdir(in_path):
             # Normalize the input path to ensure consistent relative path calculation
             in_path_normalized = os.path.normpath(in_path)
+            # Keys keep the input directory's basename as prefix, matching
+            # what os.path.relpath against its parent used to produce
+            base_rel = '' if in_path_normalized == '.' else os.path.basename(in_path_normalized) + '/'
+
+            files = list(_iter_files(in_path, base_rel))
 
-            for root, dirs, files in os.walk(in_path):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    try:
-                        content = read_file_content(file_path)
-                        # Remove comments based on file extension
-                        file_extension = os.path.splitext(file)[1]
-                        # cleaned_content = remove_comments(content, file_extension)
-                        cleaned_content = content
-
-                        # Create relative path from the input directory
-                        rel_path = os.path.relpath(file_path, start=os.path.dirname(in_path_normalized) if in_path_normalized != '.' else '.')
-                        result[rel_path] = cleaned_content
-                        logger.debug(f"Read file: {rel_path} (comments removed)")
-                    except Exception as e:
-                        logger.error(f"Failed to read file {file_path}: {e}")
-                        # Still add the file with an error message using relative path
-                        rel_path = os.path.relpath(file_path, start=os.path.dirname(in_path_normalized) if in_path_normalized != '.' else '.')
-                        result[rel_path] = f"Error reading file: {e}"
+            # File reads are blocking IO, so overlap them with a thread pool;
+            # read_file_content reports failures as error strings, which end
+            # up in the result dict just like before
+            max_workers = min(32, (os.cpu_count() or 1) * 4)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                contents = list(executor.map(read_file_content, [p for p, _ in files]))
+
+            for (file_path, rel_path), content in zip(files, contents):
+                # Remove comments based on file extension
+                # cleaned_content = remove_comments(content, '.' + rel_path.rpartition('.')[2])
+                cleaned_content = content
+
+                result[rel_path] = cleaned_content
+                logger.debug(f"Read file: {rel_path} (comments removed)")
 
         else:
             logger.error(f"Path is neither file nor directory: {in_path}")
@@ -349,315 +533,249 @@ def path_to_content_dict(in_path):
     return result
 
 
-class EntityCreator:
+class SqlToJavaConverter:
     """
-    A class to convert SQL schema definitions to Java entity classes.
+    Convert a directory of SQL source files to Java code via the schema agent.
 
-    This class reads all SQL schema files from the Schema directory,
-    converts each schema to a corresponding Java entity class using an LLM,
-    and stores the generated entities in both files and a metadata JSON.
+    The Entity, Function and Trigger creators were three near-identical
+    copies of the same workflow; this class carries the shared logic once,
+    parameterized by source/output directories, prompt labels and the
+    field names used in the metadata JSON. Subclasses below only bind the
+    parameters (and keep the historical class names alive).
     """
 
-    def __init__(self, content):
+    def __init__(self, src_dir, out_dir, metadata_path, source_label,
+                 target_label, name_field, content_field,
+                 out_name_field, out_content_field):
         """
-        Initialize the EntityCreator with a prompt template for conversion.
+        Initialize the converter with its directory and labelling parameters.
 
         Args:
-            content: Additional content or configuration (currently unused)
+            src_dir (str): Directory scanned for .sql input files
+            out_dir (str): Directory the generated .java files are written to
+            metadata_path (str): Path of the metadata JSON collecting results
+            source_label (str): Source description passed to the schema agent
+            target_label (str): Target description passed to the schema agent
+            name_field (str): Key used for the source name in item dicts
+            content_field (str): Key used for the source content in item dicts
+            out_name_field (str): Metadata key for the generated file name
+            out_content_field (str): Metadata key for the generated code
+        """
+        self.src_dir = src_dir
+        self.out_dir = out_dir
+        self.metadata_path = metadata_path
+        self.source_label = source_label
+        self.target_label = target_label
+        self.name_field = name_field
+        self.content_field = content_field
+        self.out_name_field = out_name_field
+        self.out_content_field = out_content_field
+        self.items = []
+        self.cache_dir = f"../out/.cache/"
+
+    def _cache_path(self, sc):
         """
-        self.schemas = []
+        Disk-cache path for one conversion, keyed by a content hash.
 
-    def read_all_schemas(self):
+        The hash covers the source content and both prompt labels, so an
+        edited SQL file or a different conversion target misses the cache
+        while unchanged inputs are reused across runs.
         """
-        Read all SQL schema files from the source directory.
+        digest = hashlib.sha256(
+            f"{self.source_label}|{self.target_label}|{sc[self.content_field]}".encode()
+        ).hexdigest()
+        return f"{self.cache_dir}{digest}.java"
 
-        Scans the Schema directory for .sql files and loads their contents
-        into the schemas list, with each schema represented as a dictionary.
+    def read_all(self):
         """
-        schemas = os.listdir(f"../source/Schema/")
-        names = [f for f in schemas if f.endswith(".sql")]
+        Read all SQL files from the source directory into self.items.
+
+        Scans src_dir for .sql files and loads their contents, with each
+        file represented as a dictionary keyed by name/content fields.
+        """
+        names = [e.name for e in os.scandir(self.src_dir) if e.is_file() and e.name.endswith(".sql")]
         logger.info(names)
 
-        schemas = []
-        for name in names:
-            sp = read_sql_file(f"../source/Schema/{name}")
-            tmp = {
-                "schema_name": name,
-                "schema": str(sp)
-            }
-            schemas.append(tmp)
+        # File reads are IO-bound; fetch them concurrently
+        with ThreadPoolExecutor() as executor:
+            contents = executor.map(lambda name: read_sql_file(f"{self.src_dir}{name}"), names)
 
-        logger.info(f"Schema text length: {len(schemas)}")
-        self.schemas = schemas
+        self.items = [
+            {
+                self.name_field: name,
+                self.content_field: str(content)
+            }
+            for name, content in zip(names, contents)
+        ]
 
+        logger.info(f"{self.source_label} text length: {len(self.items)}")
 
     def prepare_output_folders(self):
         """
         Create necessary output directories if they don't exist.
         """
         # Create the destination folders
-        if not os.path.exists(f"../out/entities/"):
-            os.makedirs(f"../out/entities/")
+        os.makedirs(self.out_dir, exist_ok=True)
 
     def convert_schema_to_entity(self, sc):
         """
-        Convert a single SQL schema to a Java entity class.
+        Convert a single SQL source to Java code.
 
-        Uses the LangChain pipeline with the converter agent to transform
-        SQL schema definitions into equivalent Java entity classes.
+        Uses the LangChain pipeline with the schema agent to transform the
+        SQL source into the configured Java target.
 
         Args:
-            sc (dict): Dictionary containing schema_name and schema content
+            sc (dict): Dictionary with the configured name/content fields
 
         Returns:
-            tuple: (schema_name, filename, content) or (schema_name, None, None) on error
+            tuple: (source_name, filename, content) or (source_name, None, None) on error
         """
         try:
-            config = {"configurable": {"thread_id": int(time.time())}}
-            response = schema_agent.invoke({
-                "source": "SQL schema",
-                "target": "Java springboot entity",
-                "schema_name": sc["schema_name"],
-                "schema": sc["schema"]
-            }, config)
+            filename = sc[self.name_field].replace(".sql", ".java")
 
-            filename = sc["schema_name"].replace(".sql", ".java")
-
-            if os.path.exists(f"../out/entities/{filename}"):
-                os.remove(f"../out/entities/{filename}")
+            # Re-runs with unchanged input skip the LLM round trip entirely
+            cache_path = self._cache_path(sc)
+            if os.path.exists(cache_path):
+                logger.info(f"Cache hit for {sc[self.name_field]}, skipping agent call")
+                content = read_file_content(cache_path)
+            else:
+                config = {"configurable": {"thread_id": next(_thread_counter)}}
+                response = schema_agent.invoke({
+                    "source": self.source_label,
+                    "target": self.target_label,
+                    "schema_name": sc[self.name_field],
+                    "schema": sc[self.content_field]
+                }, config)
+                content = response["messages"][-1].content
+
+                os.makedirs(self.cache_dir, exist_ok=True)
+                Path(cache_path).write_text(content, encoding='utf-8')
 
             logger.info(f"Exporting {filename}")
-            with open(f"../out/entities/{filename}", "w") as f:
-                f.write(response["messages"][-1].content)
+            # write_text pushes the whole buffer out in one call, and the
+            # explicit utf-8 avoids mangling non-ASCII generated code on
+            # platforms whose default encoding is not utf-8
+            Path(f"{self.out_dir}{filename}").write_text(content, encoding='utf-8')
 
-            return sc["schema_name"], filename, response["messages"][-1].content
+            return sc[self.name_field], filename, content
         except Exception as e:
-            logger.info(f"Error processing {sc['schema_name']}: {e}")
-            return sc["schema_name"], None, None
+            logger.info(f"Error processing {sc[self.name_field]}: {e}")
+            return sc[self.name_field], None, None
 
-    def create_entities(self):
+    def create_all(self):
         """
-        Convert all loaded schemas to entities and save them to metadata.
+        Convert all loaded items to Java code and save them to metadata.
 
-        Process each schema in the schemas list, convert it to a Java entity,
-        and store the results in a metadata JSON file for later reference.
+        Converts each item in self.items and stores the results in the
+        configured metadata JSON file for later reference.
         """
-        entities = []
+        rows = []
+
+        # Each conversion is a network-bound LLM round trip, so fan the
+        # items out over a thread pool instead of converting serially
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(self.convert_schema_to_entity, self.items))
 
-        for sc in self.schemas:
-            schema_name, filename, response = self.convert_schema_to_entity(sc)
+        for source_name, filename, response in results:
             if filename is not None:
-                entities.append({
-                    "schema_name": schema_name,
-                    "entity_name": filename,
-                    "entity": response
+                rows.append({
+                    self.name_field: source_name,
+                    self.out_name_field: filename,
+                    self.out_content_field: response
                 })
 
-        save_to_json(f"../metadata/entities.json", entities, mode='w')
+        save_to_json(self.metadata_path, rows, mode='w')
 
     def run(self):
         """
-        Execute the complete entity creation workflow.
+        Execute the complete conversion workflow.
 
         This method orchestrates the entire process:
         1. Prepare output directories
-        2. Read all SQL schema files
-        3. Convert schemas to Java entities and save metadata
+        2. Read all SQL source files
+        3. Convert them to Java code and save metadata
         """
         self.prepare_output_folders()
-        self.read_all_schemas()
-        self.create_entities()
+        self.read_all()
+        self.create_all()
 
 
-class JavaFunctionCreator:
+class EntityCreator(SqlToJavaConverter):
     """
-    A class to convert SQL functions to Java utility functions.
-
-    This class reads all SQL function files from the Function directory,
-    converts each function to Java code using an LLM, and stores the
-    generated functions in both files and a metadata JSON.
+    Convert SQL schema definitions from the Schema directory to Java entities.
     """
 
     def __init__(self, content):
         """
-        Initialize the JavaFunctionCreator with a prompt template for conversion.
-
         Args:
             content: Additional content or configuration (currently unused)
         """
-        self.functions = []
-
-    def read_all_functions(self):
-        """
-        Read all SQL function files from the source directory.
-
-        Scans the Function directory for .sql files and loads their contents
-        into the functions list, with each function represented as a dictionary.
-        """
-        functions = os.listdir(f"../source/Function/")
-        names = [f for f in functions if f.endswith(".sql")]
-        logger.info(names)
-
-        functions = []
-        for name in names:
-            sp = read_sql_file(f"../source/Function/{name}")
-            tmp = {
-                "function_name": name,
-                "function": str(sp)
-            }
-            functions.append(tmp)
-
-        logger.info(f"function text length: {len(functions)}")
-        self.functions = functions
-
-
-    def prepare_output_folders(self):
-        """
-        Create necessary output directories if they don't exist.
-        """
-        # Create the destination folders
-        if not os.path.exists(f"../out/functions/"):
-            os.makedirs(f"../out/functions/")
+        super().__init__(
+            src_dir=f"../source/Schema/",
+            out_dir=f"../out/entities/",
+            metadata_path=f"../metadata/entities.json",
+            source_label="SQL schema",
+            target_label="Java springboot entity",
+            name_field="schema_name",
+            content_field="schema",
+            out_name_field="entity_name",
+            out_content_field="entity",
+        )
+
+    # Historical entry points
+    read_all_schemas = SqlToJavaConverter.read_all
+    create_entities = SqlToJavaConverter.create_all
+
+
+class JavaFunctionCreator(SqlToJavaConverter):
+    """
+    Convert SQL functions from the Function directory to Java utilities.
+    """
 
-    def convert_schema_to_entity(self, sc):
+    def __init__(self, content):
         """
-        Convert a single SQL function to a Java method.
-
-        Uses the LangChain pipeline with the converter agent to transform
-        SQL functions into equivalent Java methods.
-
         Args:
-            sc (dict): Dictionary containing function_name and function content
-
-        Returns:
-            tuple: (function_name, filename, content) or (function_name, None, None) on error
-        """
-        try:
-            config = {"configurable": {"thread_id": int(time.time())}}
-            response = schema_agent.invoke({
-                "source": "SQL functions",
-                "target": "Java springboot utility",
-                "schema_name": sc["function_name"],
-                "schema": sc["function"]
-            }, config)
-
-            filename = sc["function_name"].replace(".sql", ".java")
-
-            if os.path.exists(f"../out/functions/{filename}"):
-                os.remove(f"../out/functions/{filename}")
-
-            logger.info(f"Exporting {filename}")
-            with open(f"../out/functions/{filename}", "w") as f:
-                f.write(response["messages"][-1].content)
-
-            return sc["function_name"], filename, response["messages"][-1].content
-        except Exception as e:
-            logger.info(f"Error processing {filename}: {e}")
-            return sc["function_name"], None, None
-
-    def create_functions(self):
-        """
-        Convert all loaded SQL functions to Java methods and save them to metadata.
-
-        Process each function in the functions list, convert it to Java code,
-        and store the results in a metadata JSON file for later reference.
+            content: Additional content or configuration (currently unused)
         """
-        functions = []
-
-        for sc in self.functions:
-            function_name, filename, response = self.convert_schema_to_entity(sc)
-            if filename is not None:
-                functions.append({
-                    "function_name": function_name,
-                    "java_function_name": filename,
-                    "java_function": response
-                })
-
-        save_to_json(f"../metadata/functions.json", functions, mode='w')
+        super().__init__(
+            src_dir=f"../source/Function/",
+            out_dir=f"../out/functions/",
+            metadata_path=f"../metadata/functions.json",
+            source_label="SQL functions",
+            target_label="Java springboot utility",
+            name_field="function_name",
+            content_field="function",
+            out_name_field="java_function_name",
+            out_content_field="java_function",
+        )
+
+    # Historical entry points
+    read_all_functions = SqlToJavaConverter.read_all
+    create_functions = SqlToJavaConverter.create_all
+
+
+class TriggerCreator(SqlToJavaConverter):
+    """
+    Convert SQL triggers from the Trigger directory to Java utilities.
+    """
 
-    def run(self):
+    def __init__(self, content):
         """
-        Execute the complete function conversion workflow.
-
-        This method orchestrates the entire process:
-        1. Prepare output directories
-        2. Read all SQL function files
-        3. Convert functions to Java code and save metadata
+        Args:
+            content: Additional content or configuration (currently unused)
         """
-        self.prepare_output_folders()
-        self.read_all_functions()
-        self.create_functions()
-
-class TriggerCreator:
-    def __init__(self, content):
-        self.pt = ChatPromptTemplate([
-            ("system", "You are a SQL and Java Springboot expert, read attached SQL Trigger and generate corresponding springboot utility to use. Genereate only java code and noting else."),
-            ("user", "{trigger_name}\n\n{trigger}")
-        ])
-        self.triggers = []
-
-    def read_all_triggers(self):
-        triggers = os.listdir(f"../source/Trigger/")
-        names = [f for f in triggers if f.endswith(".sql")]
-        logger.info(names)
-
-        triggers = []
-        for name in names:
-            sp = read_sql_file(f"../source/Trigger/{name}")
-            tmp = {
-                "trigger_name": name,
-                "trigger": str(sp)
-            }
-            triggers.append(tmp)
-
-        logger.info(f"Schema text length: {len(triggers)}")
-        self.triggers = triggers
-
-
-    def prepare_output_folders(self):
-        # Create the destination folders
-        if not os.path.exists(f"../out/triggers/"):
-            os.makedirs(f"../out/triggers/")
-
-    def convert_schema_to_entity(self, sc):
-        try:
-            config = {"configurable": {"thread_id": int(time.time())}}
-            response = schema_agent.invoke({
-                "source": "SQL triggers",
-                "target": "Java springboot utility",
-                "schema_name": sc["trigger_name"],
-                "schema": sc["trigger"]
-            }, config)
-
-            filename = sc["trigger_name"].replace(".sql", ".java")
-
-            if os.path.exists(f"../out/triggers/{filename}"):
-                os.remove(f"../out/triggers/{filename}")
-
-            logger.info(f"Exporting {filename}")
-            with open(f"../out/triggers/{filename}", "w") as f:
-                f.write(response["messages"][-1].content)
-
-            return sc["trigger_name"], filename, response["messages"][-1].content
-        except Exception as e:
-            logger.info(f"Error processing {filename}: {e}")
-            return sc["trigger_name"], None, None
-
-    def create_triggers(self):
-        triggers = []
-
-        for sc in self.schemas:
-            trigger_name, filename, response = self.convert_schema_to_entity(sc)
-            if filename is not None:
-                triggers.append({
-                    "trigger_name": trigger_name,
-                    "java_function_name": filename,
-                    "java_function": response
-                })
-
-        save_to_json(f"../metadata/triggers.json", triggers, mode='w')
-
-    def run(self):
-        self.prepare_output_folders()
-        self.read_all_triggers()
-        self.create_triggers()
+        super().__init__(
+            src_dir=f"../source/Trigger/",
+            out_dir=f"../out/triggers/",
+            metadata_path=f"../metadata/triggers.json",
+            source_label="SQL triggers",
+            target_label="Java springboot utility",
+            name_field="trigger_name",
+            content_field="trigger",
+            out_name_field="java_function_name",
+            out_content_field="java_function",
+        )
+
+    # Historical entry points
+    read_all_triggers = SqlToJavaConverter.read_all
+    create_triggers = SqlToJavaConverter.create_all
@@ -1,5 +1,4 @@
 import os
-import json
 import time
 import re
 import subprocess
@@ -12,12 +11,47 @@ from agents.element.ImprovementAgent import sp_improvement_agent
 from agents.element.POMAgent import pom_agent
 from agents.element.DockerAgent import DockerAgent, DockerRuntimeConfig
 from agents.element.CodeAnalysisAgent import code_analysis_agent, sp_analysis_agent
-from agents.element.base_utils import read_sql_file, find_from_json, json_to_dict
+from agents.element.base_utils import (
+    append_to_jsonl,
+    find_from_json,
+    json_to_dict,
+    load_jsonl_index,
+    read_sql_file,
+    save_to_json,
+)
 
 from typing import Iterable, List, TypeVar
 
 logger = logging.getLogger(__name__)
 
+# Converted SP code is appended to the JSONL log (one compact line per
+# save); the legacy JSON document remains readable as fallback
+SP_METADATA_LOG = f"../metadata/stored_procedure.jsonl"
+SP_METADATA_PATH = f"../metadata/stored_procedure.json"
+
+
+def find_stored_procedure(name):
+    """
+    Look up converted stored procedure code by file name.
+
+    Checks the append-only JSONL log first (later lines win), then falls
+    back to the legacy stored_procedure.json for entries recorded before
+    the append-only switch.
+
+    Args:
+        name: Stored procedure file name (e.g. "MySP.sql")
+
+    Returns:
+        The converted code dict, or None if the SP is unknown
+    """
+    if os.path.exists(SP_METADATA_LOG):
+        code = load_jsonl_index(SP_METADATA_LOG).get(name)
+        if code is not None:
+            return code
+    if os.path.exists(SP_METADATA_PATH):
+        return find_from_json(SP_METADATA_PATH, key=name)
+    return None
+
 
 class SPConverter:
     """
@@ -154,7 +188,7 @@ class SPConverter:
             for sp in self.dependancies.internal_stored_procedures:
                 if not sp.endswith(".sql"):
                     sp = f"{sp}.sql"
-                sps = find_from_json(f"../metadata/stored_procedure.json", key=f"{sp}")
+                sps = find_stored_procedure(f"{sp}")
                 if sps:
                     logger.info(f"Found SP: {sp}")
                     stored_procedures += f"{sp}\n{sps}\n\n"
@@ -276,7 +310,7 @@ class SPConverter:
             if not self.name.endswith(".sql"):
                 self.name = f"{self.name}.sql"
             if not self.code:
-                self.code = find_from_json(f"../metadata/stored_procedure.json", key=self.name)
+                self.code = find_stored_procedure(self.name)
 
             config = {"configurable": {"thread_id":  self.thread_id}}
             response = pom_agent.invoke({
@@ -311,14 +345,16 @@ class SPConverter:
                     logger.info(f"Exported {filename} to {filepath}")
 
             ## Export Evaluation
+            # Serialize straight from the Pydantic model; .dict() plus
+            # json.dumps would walk the object twice
             with open(f"../out/SP/{self.name}/evaluation.json", 'w') as file:
-                file.write(json.dumps(self.evaluation.dict(), indent=4))
+                file.write(self.evaluation.model_dump_json(indent=4))
                 logger.info(f"Exported evaluation to ../out/SP/{self.name}/evaluation.json")
 
             ## Export Dependancies
             if not os.path.exists(f"../out/SP/{self.name}/dependancies.json"):
                 with open(f"../out/SP/{self.name}/dependancies.json", 'w') as file:
-                    file.write(json.dumps(self.dependancies.dict(), indent=4))
+                    file.write(self.dependancies.model_dump_json(indent=4))
                     logger.info(f"Exported dependancies to ../out/SP/{self.name}/dependancies.json")
         except Exception as e:
             logger.info(f"Error exporting code: {e}")
@@ -523,17 +559,11 @@ class SPConverter:
             return 1
 
     def save_code(self) -> None:
-        if not os.path.exists(f"../metadata/stored_procedure.json"):
-            with open(f"../metadata/stored_procedure.json", 'w') as file:
-                file.write(json.dumps({f"{self.name}": self.code}, indent=4))
-                logger.info(f"Exported dependancies to ../metadata/stored_procedure.json")
-        else:
-            with open(f"../metadata/stored_procedure.json", 'r') as file:
-                data = json.load(file)
-                data[f"{self.name}"] = self.code
-            with open(f"../metadata/stored_procedure.json", 'w') as file:
-                file.write(json.dumps(data, indent=4))
-                logger.info(f"Exported dependancies to ../metadata/stored_procedure.json")
+        # Append-only: one compact JSONL line per SP. The old
+        # read-modify-rewrite of stored_procedure.json re-serialized the
+        # whole document for every SP, i.e. quadratic IO as it grew.
+        append_to_jsonl(SP_METADATA_LOG, {f"{self.name}": self.code})
+        logger.info(f"Exported dependancies to {SP_METADATA_LOG}")
 
     def runV1(self) -> None:
         """
@@ -666,7 +696,7 @@ def analyseCode(sp_name):
         code_name: Name of the Java code file to analyze
     """
     try:
-        code = find_from_json(f"../metadata/stored_procedure.json", key=sp_name)
+        code = find_stored_procedure(sp_name)
         response = code_analysis_agent.invoke({
             "stored_procedure": code
         })
@@ -691,7 +721,7 @@ def improve_existing_solution(sp_name):
     """
     try:
         sp = read_sql_file(f"../source/StoredProcedure/{sp_name}")
-        code = find_from_json(f"../metadata/stored_procedure.json", key=sp_name)
+        code = find_stored_procedure(sp_name)
 
         sample = ""
         directory = "../source/sample/"
@@ -703,12 +733,12 @@ def improve_existing_solution(sp_name):
                 content = file.read()
                 sample += f"\n{filename}\n```\n{content}```\n\n"
 
-        with open(f"out/SP/{sp_name}/dependancies.json") as f:
-            improvements = json.load(f.read())
-            improvements = improvements["improvements"]
+        # (was json.load(f.read()), which passes a str where json.load
+        # wants a file object and raised on every call)
+        improvements = find_from_json(f"out/SP/{sp_name}/dependancies.json")["improvements"]
         logger.info(improvements)
 
-        code = find_from_json(f"../metadata/stored_procedure.json", key=sp_name)
+        code = find_stored_procedure(sp_name)
         response = sp_improvement_agent.invoke({
             "stored_procedure": sp,
             "code": code,
@@ -719,16 +749,13 @@ def improve_existing_solution(sp_name):
         code = json_to_dict(response.content)
 
         if not os.path.exists(f"../metadata/stored_procedureV3.json"):
-            with open(f"../metadata/stored_procedureV3.json", 'w') as file:
-                file.write(json.dumps({f"{sp_name}": code}, indent=4))
-                logger.info(f"Exported dependancies to ../metadata/stored_procedureV3.json")
+            save_to_json(f"../metadata/stored_procedureV3.json", {f"{sp_name}": code})
+            logger.info(f"Exported dependancies to ../metadata/stored_procedureV3.json")
         else:
-            with open(f"../metadata/stored_procedure.json", 'r') as file:
-                data = json.load(file)
-                data[f"{sp_name}"] = code
-            with open(f"../metadata/stored_procedure.json", 'w') as file:
-                file.write(json.dumps(data, indent=4))
-                logger.info(f"Exported dependancies to ../metadata/stored_procedureV3.json")
+            data = find_from_json(f"../metadata/stored_procedure.json")
+            data[f"{sp_name}"] = code
+            save_to_json(f"../metadata/stored_procedure.json", data)
+            logger.info(f"Exported dependancies to ../metadata/stored_procedureV3.json")
 
         return code
     except Exception as e:
@@ -1,4 +1,5 @@
 # code of agent one
+import functools
 from typing import Any
 
 from langchain_core.prompts import ChatPromptTemplate
@@ -8,7 +9,19 @@ from pydantic import BaseModel, Field
 from core.model import AzureOpenAIModel
 
 #########  AI MODEL #########
-model = AzureOpenAIModel.get_model("gpt-4o")
+@functools.cache
+def _get_model():
+    # Built on first use rather than at import, so importing the module
+    # does not construct the model before it is needed
+    return AzureOpenAIModel.get_model("gpt-4o")
+
+
+#########  PROMPTS  ##############
+# Module-level so every call sends the identical system prefix; provider
+# prompt caches only hit on byte-stable prefixes. The question stays in
+# the final human turn.
+SYSTEM_PROMPT = """You are a helpful assistant named Sheldon. You know about everything in this world and can answer questions."""
+USER_PROMPT = """{question}"""
 
 
 #########  DATA MODEL  ##############
@@ -17,25 +30,24 @@ class AnswerAgentOut(BaseModel):
     justification: str = Field(description="justification for the output")
 
 
-#########  AGENTS  ##############
-def answer_agent(state) -> dict[str, Any]:
-    print("Invoking answer agent")
-    question = state["input"]
-    structured_llm = model.with_structured_output(AnswerAgentOut)
-
-    system_prompt = """You are a helpful assistant named Sheldon. You know about everything in this world and can answer questions."""
-    user_prompt = """{question}"""
-
-    # Prompt
+@functools.cache
+def _get_answer_chain():
+    # Bound once: with_structured_output reflects AnswerAgentOut into a
+    # JSON schema, which per-call rebuilding repeated for every question
     _prompt = ChatPromptTemplate.from_messages(
         [
-            ("system", system_prompt),
-            ("human", user_prompt),
+            ("system", SYSTEM_PROMPT),
+            ("human", USER_PROMPT),
         ]
     )
+    return _prompt | _get_model().with_structured_output(AnswerAgentOut)
+
 
-    agent = _prompt | structured_llm
+#########  AGENTS  ##############
+def answer_agent(state) -> dict[str, Any]:
+    print("Invoking answer agent")
+    question = state["input"]
 
-    response = agent.invoke({"question": question})
+    response = _get_answer_chain().invoke({"question": question})
     return {"output": response.output, "justification": response.justification}
 
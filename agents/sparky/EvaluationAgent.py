@@ -4,8 +4,12 @@ from typing import List
 
 from config import logger
 from core.model import AzureOpenAIModel
+from agents.sparky.base_utils import load_cached_response, store_cached_response
 from agents.sparky.prompts import EVALUATION_SYS_PROMPT, EVALUATION_USER_PROMPT
 
+# Bump when the evaluation prompts change so stale cached responses miss
+_PROMPT_VERSION = "v1"
+
 
 model = AzureOpenAIModel.get_model("gpt-5-mini")
 
@@ -41,7 +45,17 @@ def evaluate(state):
     input_code = state["input_code"]
     converted_files = state["converted_files"]
     logger.info("🔍 Starting Evaluation ...")
-    result = evaluation_agent.invoke({"converted_code": converted_files, "input_code": input_code})
+
+    # Deterministic in its inputs, so re-evaluating an unchanged
+    # conversion (retries, repeat runs) reuses the stored verdict
+    cache_key = ("evaluate", _PROMPT_VERSION, str(input_code), str(converted_files))
+    cached = load_cached_response(*cache_key)
+    if cached is not None:
+        logger.info("✅ Evaluation cache hit, skipping model call ...")
+        result = EvaluationOut.model_validate_json(cached)
+    else:
+        result = evaluation_agent.invoke({"converted_code": converted_files, "input_code": input_code})
+        store_cached_response(result.model_dump_json(), *cache_key)
     logger.info("✅ Evaluation Completed ...")
     logger.info(f"🎯 Score: {result.score}")
     return {
@@ -1,3 +1,5 @@
+import asyncio
+import functools
 import logging
 from langchain_core.prompts import ChatPromptTemplate
 from core.model import AzureOpenAIModel
@@ -5,8 +7,13 @@ from agents.sparky.PyConverterAgent import OutFiles
 from agents.sparky.prompts import IMPROVEMENT_SYS_PROMPT, IMPROVEMENT_USER_PROMPT
 
 logger = logging.getLogger(__name__)
-model = AzureOpenAIModel.get_model("o1")
 
+# Placeholder order in the user template is part of the performance
+# contract: input_code (invariant across the whole improve loop) comes
+# first, converted_code (changes once per iteration) second, and
+# improvements (different for every chunked call) last. That keeps the
+# longest possible byte-stable prefix behind the static system prompt,
+# which is what provider-side prompt caches key on.
 spark_improvement_prompt = ChatPromptTemplate.from_messages(
     [
         ("system", IMPROVEMENT_SYS_PROMPT),
@@ -15,34 +22,68 @@ spark_improvement_prompt = ChatPromptTemplate.from_messages(
 )
 
 
-structure_model = model.with_structured_output(OutFiles)
-spark_improvement_agent = spark_improvement_prompt | structure_model
+@functools.cache
+def get_improvement_chain():
+    """
+    Build the improvement chain once, on first use.
 
-def spark_improve(state):
+    Deferred from import time so the model (and any token round trip in
+    get_model) is only constructed when an improvement actually runs.
+    """
+    model = AzureOpenAIModel.get_model("o1")
+    return spark_improvement_prompt | model.with_structured_output(OutFiles)
+
+# Improvement lists up to this size go out as one call; each extra call
+# re-sends the full input and converted code, so batching amortizes that
+# prefill. Beyond it the list is chunked to keep single prompts bounded.
+_SINGLE_CALL_LIMIT = 21
+_CHUNK_SIZE = 7
+
+
+async def spark_improve_async(state):
+    """
+    Apply the improvement list to the current conversion.
+
+    Small improvement lists go out as one call - every call echoes the
+    full input and converted code, so fewer calls means fewer repeats of
+    that prefix. Longer lists fall back to chunks of 7 applied
+    sequentially, each against the previous chunk's output: the prompt
+    contract returns a complete rewrite of the whole file set per call,
+    so chunks must build on each other or all but the last are lost.
+    Concurrency comes from running many files' pipelines at once, not
+    from within one file's improvement pass.
+    """
     input_code = state["input_code"]
     converted_files = state["converted_files"]
     improvements = state["improvements"]
     logger.info("🛠️ Starting Improvement ...")
     logger.info(f"We have {len(improvements)} improvements to apply.")
 
-    # loop to apply max 3 improvements at a time.
-    range_value = 7
-    for i in range(0, len(improvements), range_value):
-        logger.info(f"Applying improvements {i} to {i+range_value}.")
-        result = spark_improvement_agent.invoke({
+    if len(improvements) <= _SINGLE_CALL_LIMIT:
+        chunks = [improvements]
+    else:
+        chunks = [improvements[i:i+_CHUNK_SIZE] for i in range(0, len(improvements), _CHUNK_SIZE)]
+
+    for chunk in chunks:
+        result = await get_improvement_chain().ainvoke({
             "input_code": input_code,
             "converted_code": converted_files,
-            "improvements": improvements[i:i+range_value]
+            "improvements": chunk
         })
         converted_files = result.files
 
     logger.info("✅ Improvement Completed ...")
     return {
-        "converted_files": result.files,
+        "converted_files": converted_files,
         "iteration": state["iteration"] + 1
     }
 
 
+def spark_improve(state):
+    # Sync entry point for the blocking graph.invoke path
+    return asyncio.run(spark_improve_async(state))
+
+
 
 
 
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import os
 from typing import Dict, List, TypedDict
@@ -7,7 +8,7 @@ from langgraph.graph import END, StateGraph
 from config import logger
 from agents.sparky.PyConverterAgent import spark_convert, spark_export
 from agents.sparky.EvaluationAgent import evaluate
-from agents.sparky.ImprovementAgent import spark_improve
+from agents.sparky.ImprovementAgent import spark_improve_async
 from agents.sparky.base_utils import path_to_content_dict
 
 
@@ -46,7 +47,8 @@ def _route_after_evaluate(state: PySparkState) -> str:
 _builder = StateGraph(PySparkState)
 _builder.add_node("convert", spark_convert)
 _builder.add_node("evaluate", evaluate)
-_builder.add_node("improve", spark_improve)
+# async node; LangGraph awaits it natively under ainvoke
+_builder.add_node("improve", spark_improve_async)
 _builder.add_node("export", spark_export)
 
 _builder.set_entry_point("convert")
@@ -60,24 +62,49 @@ _builder.add_edge("export", END)
 pyspark_graph = _builder.compile()
 
 
-def run_pyspark_conversion(
-    path: str, target_score: float = 90.0, max_iters: int = 2
-) -> PySparkState:
+async def run_pyspark_conversion_async(
+    path: str, target_score: float = 90.0, max_iters: int = 2, max_concurrency: int = 4
+) -> List[PySparkState]:
     """
     Execute the convert → evaluate → improve loop until target score or max iterations.
-    Returns the final state containing converted files and evaluation data.
+
+    Each file's pipeline is independent (own input_code and out_path), so
+    all files run concurrently via pyspark_graph.ainvoke, bounded by a
+    semaphore sized to the provider's rate limit.
+    Returns the final state per file containing converted files and evaluation data.
     """
 
     code = path_to_content_dict(path)
-    outpath = path.split("/")[-1]
+    # basename of the normalized path, so trailing slashes and
+    # non-"/" separators both resolve correctly
+    outpath = os.path.basename(os.path.normpath(path))
+    out_paths = {f: os.path.join(outpath, f) for f in code}
 
-    for f in code:
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _run_one(f: str) -> PySparkState:
         logger.info(f"Processing {f}")
         initial_state: PySparkState = {
             "input_code": {f: code[f]},
             "target_score": float(target_score),
             "max_iters": int(max_iters),
             "iteration": 0,
-            "out_path": os.path.join(outpath, f)
+            "out_path": out_paths[f]
         }
-        pyspark_graph.invoke(initial_state)
+        async with semaphore:
+            return await pyspark_graph.ainvoke(initial_state)
+
+    results = await asyncio.gather(*(_run_one(f) for f in code), return_exceptions=True)
+    for f, result in zip(code, results):
+        if isinstance(result, Exception):
+            logger.error(f"❌ Conversion failed for {f}: {result}")
+    return results
+
+
+def run_pyspark_conversion(
+    path: str, target_score: float = 90.0, max_iters: int = 2
+) -> List[PySparkState]:
+    """
+    Sync entry point wrapping run_pyspark_conversion_async.
+    """
+    return asyncio.run(run_pyspark_conversion_async(path, target_score, max_iters))
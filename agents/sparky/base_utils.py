@@ -1,14 +1,62 @@
+import functools
+import hashlib
 import logging
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from charset_normalizer import from_bytes as _cn_from_bytes
+except ImportError:
+    # charset-normalizer is optional; the trial-decode sweep is the fallback
+    _cn_from_bytes = None
 
 
 logger = logging.getLogger(__name__)
 
+# Fallback encodings trial-decoded when charset-normalizer is unavailable
+_FALLBACK_ENCODINGS = ['latin1', 'cp1252', 'iso-8859-1', 'utf-16', 'utf-16-le', 'utf-16-be']
+
+# Comment tokens per file extension. Each gets one compiled pattern so
+# remove_comments strips a whole file in a single regex pass; [ \t]* in
+# front swallows the whitespace preceding an inline comment, like the old
+# rstrip did, and whole-comment lines are left empty to preserve line
+# numbering.
+_COMMENT_TOKENS = {
+    '.sql': '--',
+    '.py': '#',
+    '.java': '//',
+    '.js': '//',
+    '.ts': '//',
+    '.c': '//',
+    '.cpp': '//',
+    '.h': '//',
+    '.hpp': '//',
+    '.cs': '//',
+    '.php': '//',
+    '.rb': '#',
+    '.sh': '#',
+    '.bash': '#',
+    '.zsh': '#',
+    '.r': '#',
+    '.pl': '#',
+    '.pm': '#'
+}
+
+_COMMENT_RES = {
+    ext: re.compile(rf'[ \t]*{re.escape(token)}[^\n]*')
+    for ext, token in _COMMENT_TOKENS.items()
+}
+
 
 def read_file_content(file_path):
     """
     Read file content with robust encoding detection.
-    Uses the same encoding logic as read_sql_file but for any file type.
+
+    The file is read once as raw bytes; BOM sniffing, the utf-8 fast path
+    and the charset detection all run in memory, so no encoding attempt
+    re-reads the file (the old loop re-opened it once per candidate
+    encoding, up to 8 full reads per file).
 
     Args:
         file_path (str): Path to the file to read
@@ -16,48 +64,49 @@ def read_file_content(file_path):
     Returns:
         str: File content as string, or error message if failed
     """
-    encodings = ['utf-8', 'latin1', 'cp1252', 'iso-8859-1', 'utf-16', 'utf-16-le', 'utf-16-be']
-
-    # First, try to detect BOM to identify UTF-16 encoded files
     try:
         with open(file_path, 'rb') as f:
-            raw_data = f.read(4)
-            # Check for UTF-16 BOM markers
-            if raw_data.startswith(b'\xff\xfe') or raw_data.startswith(b'\xfe\xff'):
-                with open(file_path, 'r', encoding='utf-16') as f:
-                    content = f.read()
-                    logger.info(f"✅ Successfully read {file_path} using UTF-16 encoding (detected BOM).")
-                    return content
-    except Exception:
-        pass  # Continue with regular approach if BOM detection fails
-
-    for encoding in encodings:
+            raw = f.read()
+    except Exception as e:
+        return f"Error reading {file_path}: {e}"
+
+    # A UTF-16 BOM pins the encoding outright
+    if raw.startswith(b'\xff\xfe') or raw.startswith(b'\xfe\xff'):
         try:
-            with open(file_path, 'r', encoding=encoding) as f:
-                content = f.read()
-                # Check if content contains null bytes which indicate wrong encoding
-                if '\x00' in content:
-                    logger.info(f"Found null bytes with {encoding}, trying next...")
-                    continue
-                logger.info(f"Successfully read {file_path} using {encoding} encoding.")
-                return content
+            content = raw.decode('utf-16')
+            logger.info(f"✅ Successfully read {file_path} using UTF-16 encoding (detected BOM).")
+            return content
         except UnicodeDecodeError:
-            logger.info(f"Failed to read {file_path} with {encoding} encoding, trying next...")
-            continue
-        except Exception as e:
-            return f"Error reading {file_path}: {e}"
+            pass  # Continue with regular approach if BOM decode fails
 
-    # If all encodings failed, try binary mode and replace null bytes
+    # Fast path: most files are plain utf-8
     try:
-        with open(file_path, 'rb') as f:
-            binary_content = f.read()
-            # Remove null bytes and attempt to decode
-            cleaned_content = binary_content.replace(b'\x00', b'')
-            content = cleaned_content.decode('utf-8', errors='replace')
-            logger.info(f"Used fallback for {file_path}: binary read with null byte removal")
+        content = raw.decode('utf-8')
+        logger.info(f"Successfully read {file_path} using utf-8 encoding.")
+        return content
+    except UnicodeDecodeError:
+        pass
+
+    if _cn_from_bytes is not None:
+        # One statistical pass over the bytes instead of trial-decoding
+        # a fixed encoding list
+        best = _cn_from_bytes(raw).best()
+        if best is not None:
+            logger.info(f"Successfully read {file_path} using detected {best.encoding} encoding.")
+            return str(best)
+
+    for encoding in _FALLBACK_ENCODINGS:
+        try:
+            content = raw.decode(encoding)
+            logger.info(f"Successfully read {file_path} using {encoding} encoding.")
             return content
-    except Exception as e:
-        return f"Error: Unable to read {file_path} with any encoding: {e}"
+        except UnicodeDecodeError:
+            logger.info(f"Failed to read {file_path} with {encoding} encoding, trying next...")
+
+    # If everything failed, remove null bytes and decode with replacement
+    cleaned_content = raw.replace(b'\x00', b'')
+    logger.info(f"Used fallback for {file_path}: null byte removal with utf-8 replace")
+    return cleaned_content.decode('utf-8', errors='replace')
 
 
 def remove_comments(content, file_extension):
@@ -74,54 +123,50 @@ def remove_comments(content, file_extension):
     if not content:
         return content
 
-    lines = content.split('\n')
-    cleaned_lines = []
-
-    # Define comment patterns based on file extension
-    comment_patterns = {
-        '.sql': '--',
-        '.py': '#',
-        '.java': '//',
-        '.js': '//',
-        '.ts': '//',
-        '.c': '//',
-        '.cpp': '//',
-        '.h': '//',
-        '.hpp': '//',
-        '.cs': '//',
-        '.php': '//',
-        '.rb': '#',
-        '.sh': '#',
-        '.bash': '#',
-        '.zsh': '#',
-        '.r': '#',
-        '.pl': '#',
-        '.pm': '#'
-    }
-
-    comment_start = comment_patterns.get(file_extension.lower())
-
-    if not comment_start:
+    pattern = _COMMENT_RES.get(file_extension.lower())
+
+    if not pattern:
         # If we don't recognize the file type, return original content
         return content
 
-    for line in lines:
-        # Find the position of the comment start
-        comment_pos = line.find(comment_start)
+    # One C-level sweep over the whole buffer replaces the old per-line
+    # loop of split/find/rstrip/join
+    return pattern.sub('', content)
 
-        if comment_pos == -1:
-            # No comment in this line, keep the entire line
-            cleaned_lines.append(line)
-        elif comment_pos == 0:
-            # Line starts with comment, skip entirely (but keep empty line for structure)
-            cleaned_lines.append('')
-        else:
-            # Comment is inline, keep only the part before the comment
-            # But be careful with strings that might contain the comment pattern
-            cleaned_line = line[:comment_pos].rstrip()
-            cleaned_lines.append(cleaned_line)
 
-    return '\n'.join(cleaned_lines)
+# Directories that never hold convertible sources; descending into them
+# (VCS metadata, dependency trees) wastes the bulk of a walk's IO
+_SKIP_DIRS = {'.git', 'node_modules', '__pycache__'}
+
+# Extensions the conversion pipeline accepts as input. Deliberately wider
+# than the comment-token table: Scala sources and notebook exports are
+# convertible (conversion_system_prompt.txt lists PySpark, Scala, Spark
+# SQL and %sql blocks) even though no comment token is registered for
+# them. Extend this set, not _COMMENT_TOKENS, when new input types appear.
+_SOURCE_EXTENSIONS = frozenset(_COMMENT_TOKENS) | {'.scala', '.ipynb'}
+
+
+def _iter_source_files(root, rel=''):
+    """
+    Recursively yield (absolute_path, relative_path) for source files under root.
+
+    os.scandir hands back DirEntry objects with the file type cached, so
+    no per-entry stat() is needed, and the relative key grows incrementally
+    during recursion instead of one os.path.relpath call per file. Only
+    files with an extension in _SOURCE_EXTENSIONS are yielded - everything
+    the pipeline would read just to ignore (binaries, media) is skipped
+    before it is ever opened, with a log line so skips are visible.
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in _SKIP_DIRS:
+                    yield from _iter_source_files(entry.path, rel + entry.name + '/')
+            elif entry.is_file():
+                if os.path.splitext(entry.name)[1].lower() in _SOURCE_EXTENSIONS:
+                    yield entry.path, rel + entry.name
+                else:
+                    logger.info(f"Skipping non-source file: {entry.path}")
 
 
 def path_to_content_dict(in_path):
@@ -158,26 +203,22 @@ def path_to_content_dict(in_path):
         elif os.path.isdir(in_path):
             # Normalize the input path to ensure consistent relative path calculation
             in_path_normalized = os.path.normpath(in_path)
-
-            for root, dirs, files in os.walk(in_path):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    try:
-                        content = read_file_content(file_path)
-                        # Remove comments based on file extension
-                        file_extension = os.path.splitext(file)[1]
-                        # cleaned_content = remove_comments(content, file_extension)
-                        cleaned_content = content
-
-                        # Create relative path from the input directory
-                        rel_path = os.path.relpath(file_path, start=os.path.dirname(in_path_normalized) if in_path_normalized != '.' else '.')
-                        result[rel_path] = cleaned_content
-                        logger.debug(f"Read file: {rel_path} (comments removed)")
-                    except Exception as e:
-                        logger.error(f"Failed to read file {file_path}: {e}")
-                        # Still add the file with an error message using relative path
-                        rel_path = os.path.relpath(file_path, start=os.path.dirname(in_path_normalized) if in_path_normalized != '.' else '.')
-                        result[rel_path] = f"Error reading file: {e}"
+            # Keys keep the input directory's basename as prefix, matching
+            # what os.path.relpath against its parent used to produce
+            base_rel = '' if in_path_normalized == '.' else os.path.basename(in_path_normalized) + '/'
+
+            # Collect paths first, then read them on a thread pool: each
+            # read is blocking IO plus encoding detection, and the GIL is
+            # released during read(), so the reads overlap across files
+            file_paths = list(_iter_source_files(in_path, base_rel))
+
+            max_workers = min(32, (os.cpu_count() or 1) * 4)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                contents = executor.map(read_file_content, (fp for fp, _ in file_paths))
+                for (file_path, rel_path), content in zip(file_paths, contents):
+                    # cleaned_content = remove_comments(content, os.path.splitext(file_path)[1])
+                    result[rel_path] = content
+                    logger.debug(f"Read file: {rel_path} (comments removed)")
 
         else:
             logger.error(f"Path is neither file nor directory: {in_path}")
@@ -189,6 +230,61 @@ def path_to_content_dict(in_path):
     return result
 
 
-def read_prompt(prompt_path):
-    with open(prompt_path, 'r') as file:
+# Disk cache for deterministic LLM responses, keyed by a hash of the
+# request inputs plus a prompt version supplied by the caller
+_RESPONSE_CACHE_DIR = "../out/.cache/sparky/"
+
+
+def _response_cache_path(key_parts):
+    digest = hashlib.blake2b("|".join(key_parts).encode()).hexdigest()
+    return os.path.join(_RESPONSE_CACHE_DIR, f"{digest}.json")
+
+
+def load_cached_response(*key_parts):
+    """
+    Return the cached response payload for key_parts, or None on a miss.
+
+    Args:
+        *key_parts (str): Strings that together identify the request
+            (call kind, prompt version, input bytes)
+
+    Returns:
+        str: The stored payload, or None if nothing is cached
+    """
+    try:
+        with open(_response_cache_path(key_parts), 'r', encoding='utf-8') as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def store_cached_response(payload, *key_parts):
+    """
+    Persist a response payload under the hash of key_parts.
+
+    Args:
+        payload (str): Serialized response to store
+        *key_parts (str): Same key strings the lookup will use
+    """
+    os.makedirs(_RESPONSE_CACHE_DIR, exist_ok=True)
+    with open(_response_cache_path(key_parts), 'w', encoding='utf-8') as f:
+        f.write(payload)
+
+
+@functools.lru_cache(maxsize=None)
+def _read_prompt_cached(abs_path):
+    with open(abs_path, 'r', encoding='utf-8') as file:
         return file.read()
+
+
+def read_prompt(prompt_path):
+    """
+    Read a prompt file, cached by its absolute path.
+
+    Prompt text is embedded byte-for-byte into every LLM call and never
+    changes within a run, so repeat reads (module reloads, multiple
+    agents sharing a prompt) are served from memory. Keying on the
+    resolved absolute path keeps the cache correct if the working
+    directory changes between calls.
+    """
+    return _read_prompt_cached(os.path.abspath(prompt_path))
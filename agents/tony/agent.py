@@ -1,4 +1,5 @@
 # code of agent one
+import functools
 import json
 from typing import Any
 
@@ -15,6 +16,18 @@ from pydantic import BaseModel, Field
 model = AzureOpenAIModel.get_model("gpt-4o")
 
 
+#########  PROMPTS  ##############
+# Kept byte-identical across calls: provider-side prompt caches key on an
+# exact prefix match, so any per-call variation here would invalidate the
+# cached prefill. Volatile data (the user query) belongs in the final
+# human message only.
+SYSTEM_PROMPT = """
+    You are a helpful assistant that can take actions based on user's questions.
+    You have tools available at your disposal to take actions.
+    Always use the take_action tool to execute the user's request.
+    """
+
+
 #########  DATA MODEL  ##############
 class ActionAgentOut(BaseModel):
     output: str = Field(description="output of the message")
@@ -33,24 +46,60 @@ def take_action(action: str) -> dict[str, Any]:
     return {"action": action, "status": "success"}
 
 
-def action_agent(state: State) -> dict[str, Any]:
-    print("Invoking action agent")
-    question = state["question"]
+# Tool list shared by both variants, kept sorted by tool name. The tool
+# schemas are serialized into every request, and automatic prefix caching
+# on the provider side only hits when they arrive in the same order each
+# time - keep the sort when adding tools.
+TOOLS = sorted([take_action], key=lambda t: t.name)
 
-    system_prompt = """
-    You are a helpful assistant that can take actions based on user's questions.
-    You have tools available at your disposal to take actions.
-    Always use the take_action tool to execute the user's request.
+# One checkpointer shared by both agent variants. Checkpoints are keyed
+# by thread_id, so a conversation resumed through either entry point
+# finds its persisted state instead of starting from scratch with a
+# variant-local saver.
+_SAVER = InMemorySaver()
+
+
+@functools.lru_cache(maxsize=4)
+def _get_agent(hitl: bool = False):
     """
+    Build and cache the compiled agent per variant.
 
-    # Create agent with HumanInTheLoopMiddleware for approval
-    agent = create_agent(
+    Rebuilding the agent on every call re-bound the tools, prompt and a
+    fresh checkpointer per request; memoizing keeps one compiled graph
+    alive across turns, and both variants checkpoint into the shared
+    module-level saver.
+    """
+    if hitl:
+        # The middleware will interrupt when take_action is about to be called
+        return create_agent(
+            model=model,
+            system_prompt=SYSTEM_PROMPT,
+            tools=TOOLS,
+            checkpointer=_SAVER,
+            middleware=[
+                HumanInTheLoopMiddleware(
+                    interrupt_on={
+                        "take_action": {
+                            "allowed_decisions": ["approve", "edit", "reject"],
+                        }
+                    }
+                ),
+            ],
+        )
+    return create_agent(
         model=model,
-        system_prompt=system_prompt,
-        tools=[take_action],
-        checkpointer=InMemorySaver()
+        system_prompt=SYSTEM_PROMPT,
+        tools=TOOLS,
+        checkpointer=_SAVER
     )
 
+
+def action_agent(state: State) -> dict[str, Any]:
+    print("Invoking action agent")
+    question = state["question"]
+
+    agent = _get_agent()
+
     query = f"""User query: {question}"""
 
     inputs = {"messages": [("human", query)]}
@@ -69,29 +118,8 @@ def action_agent_hitl(state: State) -> dict[str, Any]:
     print("Invoking action agent")
     question = state["question"]
 
-    system_prompt = """
-    You are a helpful assistant that can take actions based on user's questions.
-    You have tools available at your disposal to take actions.
-    Always use the take_action tool to execute the user's request.
-    """
-
-    # Create agent with HumanInTheLoopMiddleware for approval
-    # The middleware will interrupt when take_action is about to be called
-    agent = create_agent(
-        model=model,
-        system_prompt=system_prompt,
-        tools=[take_action],
-        checkpointer=InMemorySaver(),
-        middleware=[
-            HumanInTheLoopMiddleware(
-                interrupt_on={
-                    "take_action": {
-                        "allowed_decisions": ["approve", "edit", "reject"],
-                    }
-                }
-            ),
-        ],
-    )
+    # Agent with HumanInTheLoopMiddleware for approval
+    agent = _get_agent(hitl=True)
 
     query = f"""User query: {question}"""
 